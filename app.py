@@ -1,14 +1,29 @@
 import streamlit as st
-from sqlmodel import Session, select, delete, desc, asc
+from sqlmodel import Session, select, delete, update, desc, asc
 from sqlalchemy import func
+from sqlalchemy.orm import defer
 from models import SiteConfig, Article, GlobalSettings
-from logic import init_db, engine, crawl_all_sites, analyze_specific_articles, auto_detect_config, test_crawler_config
+from logic import init_db, engine, crawl_all_sites, analyze_specific_articles, auto_detect_config, test_crawler_config, \
+    test_pagination_logic
 import asyncio
+import logging
 import pandas as pd
 import json
+import re
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
 
 st.set_page_config(page_title="AI 智能情报系统", layout="wide")
-init_db()
+
+
+# Streamlit 每次交互都会重跑脚本；建表与默认设置只需在进程内执行一次
+@st.cache_resource
+def init_db_once():
+    init_db()
+
+
+init_db_once()
 
 st.title("🚀 AI 智能情报系统")
 
@@ -21,14 +36,17 @@ tab_dashboard, tab_sources, tab_settings = st.tabs(["📊 情报看板", "⚙️
 # Tab 1: 情报看板
 # ==========================================
 with tab_dashboard:
+    # 采集控制与来源筛选共用一次查询的源列表
+    with Session(engine) as session:
+        all_sites = session.exec(select(SiteConfig)).all()
+
     with st.expander("🔎 采集控制", expanded=False):
         c1, c2, c3, c4 = st.columns([1, 1, 2, 2])
         days_back = c1.number_input("爬取天数", 1, 30, 3)
         max_pages = c2.number_input("翻页限制", 1, 20, 5)
 
-        with Session(engine) as session:
-            active_sites = session.exec(select(SiteConfig).where(SiteConfig.is_active == True)).all()
-            site_count = len(active_sites)
+        active_sites = [s for s in all_sites if s.is_active]
+        site_count = len(active_sites)
 
         c3.write("")
         c3.write("")
@@ -47,7 +65,6 @@ with tab_dashboard:
     c_f1, c_f2, c_f3, c_f4 = st.columns([1, 1, 1, 1])
 
     with Session(engine) as session:
-        all_sites = session.exec(select(SiteConfig)).all()
         f_site = c_f1.multiselect("来源筛选", [s.name for s in all_sites])
         f_status = c_f2.multiselect("状态筛选", ["done", "pending", "error"], default=["done", "pending"])
         f_score = c_f3.slider("最低评分过滤", 0, 10, 0)
@@ -57,7 +74,8 @@ with tab_dashboard:
             session.commit()
             st.rerun()
 
-        query = select(Article)
+        # 看板不展示正文与评分详情，延迟加载这两个大字段，避免每次刷新都拉取全文
+        query = select(Article).options(defer(Article.content_raw), defer(Article.ai_score_details))
         if f_status: query = query.where(Article.ai_status.in_(f_status))
         if f_site:
             s_ids = [s.id for s in all_sites if s.name in f_site]
@@ -76,18 +94,16 @@ with tab_dashboard:
             st.session_state.select_all = not st.session_state.select_all
             st.rerun()
 
-        data_list = []
-        for a in articles:
-            s_name = next((s.name for s in all_sites if s.id == a.site_id), "未知")
-            pub_date = a.publish_date.strftime("%Y-%m-%d") if a.publish_date else ""
-            data_list.append({
-                "选择": st.session_state.select_all,
-                "ID": a.id, "来源": s_name, "中文标题": a.new_title if a.new_title else a.title,
-                "英文标题": a.title_en,
-                "日期": pub_date, "分数": a.ai_score, "摘要": a.ai_summary,
-                "理由": a.ai_reasoning, "链接": a.url, "状态": a.ai_status,
-                "议题": a.ai_topic, "类别": a.ai_category
-            })
+        site_names = {s.id: s.name for s in all_sites}
+        select_all = st.session_state.select_all
+        data_list = [{
+            "选择": select_all,
+            "ID": a.id, "来源": site_names.get(a.site_id, "未知"), "中文标题": a.new_title if a.new_title else a.title,
+            "英文标题": a.title_en,
+            "日期": a.publish_date.date().isoformat() if a.publish_date else "", "分数": a.ai_score, "摘要": a.ai_summary,
+            "理由": a.ai_reasoning, "链接": a.url, "状态": a.ai_status,
+            "议题": a.ai_topic, "类别": a.ai_category
+        } for a in articles]
 
         df = pd.DataFrame(data_list)
         edited_df = st.data_editor(
@@ -120,10 +136,10 @@ with tab_dashboard:
 
 with tab_sources:
     st.subheader("情报源管理")
-    st.write("DEBUG auto_config:", st.session_state.auto_config)
     # 1. 列表展示
     with Session(engine) as session:
         sites = session.exec(select(SiteConfig)).all()
+        sites_by_id = {s.id: s for s in sites}
         if sites:
             df_sites = pd.DataFrame([{
                 "ID": s.id, "启用": s.is_active, "名称": s.name, "URL": s.url,
@@ -151,25 +167,22 @@ with tab_sources:
 
     # 如果选了已有的，填充值
     if selected_option != "➕ 新建情报源":
-        import re
-
         match = re.search(r"ID:(\d+)", selected_option)
         if match:
             current_site_id = int(match.group(1))
-            with Session(engine) as session:
-                s = session.get(SiteConfig, current_site_id)
-                if s:
-                    form_vals = {
-                        "name": s.name, "url": s.url, "active": s.is_active,
-                        "list": s.list_selector, "title": s.title_selector, "link": s.link_selector,
-                        "date": s.date_selector or "", "fmt": s.date_format or "", "next": s.next_page_selector or ""
-                    }
+            # 复用上方列表已加载的 sites，无需再按 ID 查询一次
+            s = sites_by_id.get(current_site_id)
+            if s:
+                form_vals = {
+                    "name": s.name, "url": s.url, "active": s.is_active,
+                    "list": s.list_selector, "title": s.title_selector, "link": s.link_selector,
+                    "date": s.date_selector or "", "fmt": s.date_format or "", "next": s.next_page_selector or ""
+                }
 
     # === 关键：生成动态 Key 后缀 ===
     # 如果是新建，后缀是 "new"；如果是编辑 ID=5，后缀是 "5"
     # 这样 Streamlit 就会把它们视为不同的输入框，强制刷新值
     k_suffix = str(current_site_id) if current_site_id else "new"
-    st.write("DEBUG k_suffix:", k_suffix)
 
     # AI 识别结果覆盖
     ac = st.session_state.auto_config
@@ -200,12 +213,11 @@ with tab_sources:
                 else:
                     with st.spinner("AI 识别中..."):
                         res = asyncio.run(auto_detect_config(u_in))
-                        st.write("DEBUG AI 返回:", res)
                         if "error" in res:
                             st.error(res["error"])
                         else:
                             st.session_state.auto_config = res
-                            print(f"[DEBUG] AI Result: {res}")
+                            logger.debug("AI 识别结果: %s", res)
                             st.success("识别成功")
                             st.rerun()
 
@@ -222,12 +234,12 @@ with tab_sources:
         c_b1, c_b2 = st.columns([1, 1])
         if c_b1.button("💾 保存/更新", type="primary", key=f"save_{k_suffix}"):
             with Session(engine) as session:
-                if current_site_id:  # 更新
-                    s = session.get(SiteConfig, current_site_id)
-                    s.name, s.url, s.is_active = name, u_in, is_active
-                    s.list_selector, s.title_selector, s.link_selector = list_s, title_s, link_s
-                    s.date_selector, s.date_format, s.next_page_selector = date_s, date_fmt, next_s
-                    session.add(s)
+                if current_site_id:  # 更新 (单条 UPDATE，无需先查出对象)
+                    session.exec(update(SiteConfig).where(SiteConfig.id == current_site_id).values(
+                        name=name, url=u_in, is_active=is_active,
+                        list_selector=list_s, title_selector=title_s, link_selector=link_s,
+                        date_selector=date_s, date_format=date_fmt, next_page_selector=next_s
+                    ))
                     msg = "已更新"
                 else:  # 新建
                     s = SiteConfig(
@@ -244,8 +256,8 @@ with tab_sources:
 
         if current_site_id and c_b2.button("🗑️ 删除此源", key=f"del_{k_suffix}"):
             with Session(engine) as session:
-                obj = session.get(SiteConfig, current_site_id)
-                session.delete(obj)
+                # 直接按主键删除，无需先查出对象
+                session.exec(delete(SiteConfig).where(SiteConfig.id == current_site_id))
                 session.commit()
             st.success("已删除")
             st.rerun()
@@ -273,8 +285,6 @@ with tab_sources:
             if not u_in or not list_s:
                 st.error("请完善配置")
             else:
-                from logic import test_pagination_logic
-
                 with st.spinner("尝试翻页..."):
                     selectors = {"list": list_s, "title": title_s, "next_page": next_s}
                     report = asyncio.run(test_pagination_logic(u_in, selectors))
@@ -11,7 +11,10 @@ import nest_asyncio
 nest_asyncio.apply()
 
 import json
+import logging
+import re
 from datetime import datetime, timedelta
+from urllib.parse import urljoin
 from sqlmodel import SQLModel, create_engine, Session, select
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
@@ -21,6 +24,14 @@ from bs4 import BeautifulSoup
 from openai import OpenAI
 from collections import Counter
 
+logger = logging.getLogger(__name__)
+
+# orjson 为可选依赖：安装后用于解析 crawl4ai 的抽取结果 (每页可能上百条)，否则回退到标准库
+try:
+    from orjson import loads as load_extracted
+except ImportError:
+    load_extracted = json.loads
+
 sqlite_file_name = "database.db"
 sqlite_url = f"sqlite:///{sqlite_file_name}"
 engine = create_engine(sqlite_url)
@@ -31,9 +42,41 @@ AI_CLIENT = OpenAI(
     base_url="https://api.deepseek.com"
 )
 
+# 同时爬取的站点数
+CRAWL_CONCURRENCY = 3
+
+# 同时分析的文章数 (每篇包含一次网页抓取 + 一次 AI 调用)
+AI_CONCURRENCY = 4
+
+# === Prompt 模板 (模块加载时构建，调用时只填充变量) ===
+ANALYZE_PROMPT = """
+你是情报分析师。今天是 {current_date}。
+【客户画像】{client_profile}
+【重点关注竞争对手】{comp_str}
+【分类标准】议题: {topics_str}
+【新闻内容】{content}
+请返回 JSON：{{
+    "议题": "...", "类别": "...", "摘要": "...", 
+    "中文标题": "...", "英文标题": "...",
+    "评分": <0-10>, "打分理由": "...",
+    "评分详情": {{ "战略": 0, "行业": 0, "时效": 0, "风险": 0, "落地": 0 }}
+}}
+"""
+
+DETECT_PROMPT = """
+分析 HTML 找出新闻列表 CSS 选择器。
+特别任务：观察 HTML 里的日期格式。
+返回 JSON: list, title, link, date, date_format, next_page.
+HTML: {html}
+"""
+
 
 def init_db():
     SQLModel.metadata.create_all(engine)
+    # create_all 只会为新建的表建索引；已有数据库需要按需补建
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     with Session(engine) as session:
         if not session.exec(select(GlobalSettings)).first():
             session.add(GlobalSettings())
@@ -48,13 +91,38 @@ def ensure_http(url: str) -> str:
     return url
 
 
+def ai_text(value):
+    # AI 返回的文本字段必须是字符串或缺省；列表/字典等写库时无法绑定，会让整批提交失败
+    if value is None or isinstance(value, str): return value
+    raise ValueError(f"AI 字段类型不符: {type(value).__name__}")
+
+
+# 列表页常见的纯日期写法：2024/01/02、2024.1.2、2024年1月2日 (ISO 形式由 fromisoformat 处理)
+DATE_YMD_RE = re.compile(r"(\d{4})[-/.年](\d{1,2})[-/.月](\d{1,2})日?")
+# 标题中连续空白 (换行、缩进) 折叠为单个空格
+WHITESPACE_RE = re.compile(r"\s+")
+
+
 def parse_date_smart(date_str: str, format_str: str = None):
     if not date_str: return None
     date_str = date_str.strip()
     if format_str:
         try:
             return datetime.strptime(date_str, format_str)
-        except:
+        except ValueError:
+            pass
+    # 快速路径：标准 ISO 日期 (如 2024-01-02) 直接由 C 实现解析，避免 dateparser 的语言探测开销
+    try:
+        parsed = datetime.fromisoformat(date_str)
+        if parsed.tzinfo is None:
+            return parsed
+    except ValueError:
+        pass
+    match = DATE_YMD_RE.fullmatch(date_str)
+    if match:
+        try:
+            return datetime(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
             pass
     return dateparser.parse(date_str)
 
@@ -63,145 +131,178 @@ def parse_date_smart(date_str: str, format_str: str = None):
 async def crawl_all_sites(site_ids: list, days_back: int, max_pages: int):
     stats = {"total_crawled": 0, "new_added": 0, "duplicates": 0, "details": []}
 
+    cutoff_date = datetime.now() - timedelta(days=days_back)
+    browser_config = BrowserConfig(headless=False, verbose=True, user_agent_mode="random")
+
     with Session(engine) as session:
-        cutoff_date = datetime.now() - timedelta(days=days_back)
-        browser_config = BrowserConfig(headless=False, verbose=True, user_agent_mode="random")
+        # 一次查询取出所有待爬且已启用的源，未启用的在 SQL 中直接过滤
+        configs = session.exec(
+            select(SiteConfig).where(SiteConfig.id.in_(site_ids), SiteConfig.is_active == True)
+        ).all()
+    if len(configs) < len(site_ids):
+        logger.info("跳过 %d 个未启用或不存在的源", len(site_ids) - len(configs))
 
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            for site_id in site_ids:
-                config = session.get(SiteConfig, site_id)
-                if not config: continue
-                if not config.is_active:
-                    print(f"[SKIP] 跳过未启用: {config.name}")
-                    continue
-
-                site_stat = {"name": config.name, "new": 0, "dup": 0}
-                base_url = ensure_http(config.url)
-
-                # === 判断分页模式 ===
-                # 模式 A: URL 包含 {n} -> 数字分页
-                # 模式 B: CSS 选择器 -> 动态翻页
-                is_number_pagination = "{n}" in base_url
-
-                print(f"[INFO] 开始爬取: {config.name} (模式: {'数字分页' if is_number_pagination else 'CSS翻页'})")
-
-                current_url = base_url
-                page_num = 1
-
-                while page_num <= max_pages:
-                    # 1. 确定当前页 URL
-                    if is_number_pagination:
-                        current_url = base_url.replace("{n}", str(page_num))
-                    # else: CSS 模式下 current_url 会在循环末尾更新
-
-                    if not current_url: break
-
-                    print(f"   🕷️ 抓取第 {page_num} 页: {current_url}")
-
-                    # 2. 构建提取规则
-                    fields = [
-                        {"name": "title", "selector": config.title_selector, "type": "text"},
-                        {"name": "url", "selector": config.link_selector, "type": "attribute", "attribute": "href"},
-                    ]
-                    if config.date_selector:
-                        fields.append({"name": "date", "selector": config.date_selector, "type": "text"})
-
-                    # 只有 CSS 模式才需要提取下一页链接
-                    if config.next_page_selector and not is_number_pagination:
-                        fields.append({"name": "next_page", "selector": config.next_page_selector, "type": "attribute",
-                                       "attribute": "href"})
-
-                    schema = {"baseSelector": config.list_selector, "fields": fields}
-
-                    run_config = CrawlerRunConfig(
-                        extraction_strategy=JsonCssExtractionStrategy(schema),
-                        cache_mode=CacheMode.BYPASS,
-                        js_code="window.scrollTo(0, document.body.scrollHeight);",
-                        wait_for="body"
-                    )
+    sem = asyncio.Semaphore(CRAWL_CONCURRENCY)
+    known_urls = set()  # 本轮爬取中已确认在库 (或刚写入) 的链接，各站点共享
 
-                    result = await crawler.arun(url=current_url, config=run_config)
+    async def crawl_one(crawler, config):
+        async with sem:
+            return await crawl_single_site(crawler, config, cutoff_date, max_pages, stats, known_urls)
 
-                    if not result.success:
-                        print(f"   [ERROR] 页面加载失败")
-                        break
+    async with AsyncWebCrawler(config=browser_config) as crawler:
+        # 各站点之间互不依赖，限流并发抓取；每个站点使用独立 Session
+        stats["details"] = await asyncio.gather(*(crawl_one(crawler, c) for c in configs))
 
-                    try:
-                        items = json.loads(result.extracted_content)
-                    except:
-                        items = []
+    return stats
 
-                    if not items:
-                        print(f"   [WARN] 本页无数据")
-                        break
 
-                    next_page_link = None
-                    has_valid_date_in_page = False  # 本页是否有符合时间的数据
-
-                    # 3. 处理数据
-                    for item in items:
-                        # 提取下一页 (仅 CSS 模式)
-                        if not is_number_pagination and config.next_page_selector and item.get(
-                                'next_page') and not next_page_link:
-                            next_page_link = item.get('next_page')
-
-                        if not item.get('title') or not item.get('url'): continue
-
-                        full_url = item['url']
-                        if not full_url.startswith('http'):
-                            from urllib.parse import urljoin
-                            full_url = urljoin(current_url, full_url)
-
-                        pub_date = parse_date_smart(item.get('date'), config.date_format)
-
-                        # 宽松过滤：如果有日期且太旧则跳过；无日期则保留
-                        if pub_date:
-                            if pub_date < cutoff_date:
-                                continue
-                            else:
-                                has_valid_date_in_page = True
-                        else:
-                            has_valid_date_in_page = True  # 无日期也算有效，防止漏抓
-
-                        exists = session.exec(select(Article).where(Article.url == full_url)).first()
-                        if exists:
-                            site_stat["dup"] += 1
-                            stats["duplicates"] += 1
-                        else:
-                            article = Article(
-                                site_id=config.id,
-                                title=item['title'],
-                                url=full_url,
-                                publish_date=pub_date
-                            )
-                            session.add(article)
-                            site_stat["new"] += 1
-                            stats["new_added"] += 1
-
-                        stats["total_crawled"] += 1
-
-                    session.commit()
-                    page_num += 1
-
-                    # 4. 翻页判断
-                    if is_number_pagination:
-                        # 数字模式：如果本页完全没有符合日期的数据，可能后面更旧了，可以选择提前停止
-                        # 但为了保险，我们只依赖 max_pages 限制，或者如果提取到的 items 为空则停止
-                        pass
+async def crawl_single_site(crawler, config: SiteConfig, cutoff_date: datetime, max_pages: int, stats: dict,
+                            known_urls: set):
+    site_stat = {"name": config.name, "new": 0, "dup": 0}
+    base_url = ensure_http(config.url)
+
+    # === 判断分页模式 ===
+    # 模式 A: URL 包含 {n} -> 数字分页
+    # 模式 B: CSS 选择器 -> 动态翻页
+    is_number_pagination = "{n}" in base_url
+
+    logger.info("开始爬取: %s (模式: %s)", config.name, "数字分页" if is_number_pagination else "CSS翻页")
+
+    # 构建提取规则 (只依赖站点配置，整个站点的所有页复用同一份)
+    fields = [
+        {"name": "title", "selector": config.title_selector, "type": "text"},
+        {"name": "url", "selector": config.link_selector, "type": "attribute", "attribute": "href"},
+    ]
+    if config.date_selector:
+        fields.append({"name": "date", "selector": config.date_selector, "type": "text"})
+
+    # 只有 CSS 模式才需要提取下一页链接
+    if config.next_page_selector and not is_number_pagination:
+        fields.append({"name": "next_page", "selector": config.next_page_selector, "type": "attribute",
+                       "attribute": "href"})
+
+    schema = {"baseSelector": config.list_selector, "fields": fields}
+
+    run_config = CrawlerRunConfig(
+        extraction_strategy=JsonCssExtractionStrategy(schema),
+        cache_mode=CacheMode.BYPASS,
+        js_code="window.scrollTo(0, document.body.scrollHeight);",
+        wait_for="body"
+    )
+
+    current_url = base_url
+    page_num = 1
+    # 同一站点列表页的日期文本大量重复 (同一天多篇)，按原始文本缓存解析结果，少走 dateparser 慢路径；
+    # 缓存只在本次爬取内有效，"3小时前" 之类的相对日期不会过期
+    date_cache = {}
+
+    with Session(engine) as session:
+        while page_num <= max_pages:
+            # 1. 确定当前页 URL
+            if is_number_pagination:
+                current_url = base_url.replace("{n}", str(page_num))
+            # else: CSS 模式下 current_url 会在循环末尾更新
+
+            if not current_url: break
+
+            logger.debug("抓取第 %d 页: %s", page_num, current_url)
+
+            result = await crawler.arun(url=current_url, config=run_config)
+
+            if not result.success:
+                logger.error("页面加载失败: %s (%s)", current_url, result.error_message)
+                break
+
+            try:
+                items = load_extracted(result.extracted_content)
+            except (TypeError, ValueError):  # 无抽取结果 (None) 或 JSON 不合法
+                items = []
+
+            if not items:
+                logger.warning("本页无数据: %s", current_url)
+                break
+
+            next_page_link = None
+            has_valid_date_in_page = False  # 本页是否有符合时间的数据
+            candidates = []  # 通过时间过滤的条目: (url, title, pub_date)
+
+            # 2. 处理数据
+            for item in items:
+                # 提取下一页 (仅 CSS 模式)
+                if not is_number_pagination and config.next_page_selector and item.get(
+                        'next_page') and not next_page_link:
+                    next_page_link = item.get('next_page')
+
+                # 列表页抽取的标题常带换行/缩进，链接也可能带空白；统一规范化，避免同一篇文章被当成不同链接
+                title = WHITESPACE_RE.sub(" ", item.get('title') or "").strip()
+                full_url = (item.get('url') or "").strip()
+                if not title or not full_url: continue
+
+                if not full_url.startswith('http'):
+                    full_url = urljoin(current_url, full_url)
+
+                raw_date = item.get('date')
+                if raw_date not in date_cache:
+                    date_cache[raw_date] = parse_date_smart(raw_date, config.date_format)
+                pub_date = date_cache[raw_date]
+
+                # 宽松过滤：如果有日期且太旧则跳过；无日期则保留
+                if pub_date:
+                    if pub_date < cutoff_date:
+                        continue
                     else:
-                        # CSS 模式：如果没有下一页链接，停止
-                        if next_page_link:
-                            if not next_page_link.startswith('http'):
-                                from urllib.parse import urljoin
-                                next_page_link = urljoin(current_url, next_page_link)
-                            current_url = next_page_link
-                        else:
-                            print("   🏁 无下一页，停止")
-                            break
-
-                stats["details"].append(site_stat)
+                        has_valid_date_in_page = True
+                else:
+                    has_valid_date_in_page = True  # 无日期也算有效，防止漏抓
 
-    return stats
+                candidates.append((full_url, title, pub_date))
+
+            # 本页链接一次查重，代替逐条 SELECT；本轮已确认存在的链接 (known_urls) 不再查库，同页重复的链接也由它去掉
+            unseen_urls = {c[0] for c in candidates} - known_urls
+            if unseen_urls:
+                known_urls.update(session.exec(select(Article.url).where(Article.url.in_(unseen_urls))).all())
+
+            new_articles = []
+            crawled_at = datetime.now()  # 同页文章共用一个采集时间
+            for full_url, title, pub_date in candidates:
+                if full_url in known_urls:
+                    site_stat["dup"] += 1
+                    stats["duplicates"] += 1
+                else:
+                    known_urls.add(full_url)
+                    new_articles.append(Article(
+                        site_id=config.id,
+                        title=title,
+                        url=full_url,
+                        publish_date=pub_date,
+                        crawled_at=crawled_at
+                    ))
+                    site_stat["new"] += 1
+                    stats["new_added"] += 1
+
+                stats["total_crawled"] += 1
+
+            # 整页新文章一次性加入，提交时由 SQLAlchemy 合并为批量 INSERT
+            session.add_all(new_articles)
+            session.commit()
+            page_num += 1
+
+            # 3. 翻页判断
+            if is_number_pagination:
+                # 数字模式：如果本页完全没有符合日期的数据，可能后面更旧了，可以选择提前停止
+                # 但为了保险，我们只依赖 max_pages 限制，或者如果提取到的 items 为空则停止
+                pass
+            else:
+                # CSS 模式：如果没有下一页链接，停止
+                if next_page_link:
+                    if not next_page_link.startswith('http'):
+                        next_page_link = urljoin(current_url, next_page_link)
+                    current_url = next_page_link
+                else:
+                    logger.debug("无下一页，停止: %s", config.name)
+                    break
+
+    return site_stat
 
 
 # === AI 分析 ===
@@ -223,61 +324,79 @@ async def analyze_specific_articles(article_ids: list):
 
         browser_config = BrowserConfig(headless=False, user_agent_mode="random")
 
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            for article in articles:
+        sem = asyncio.Semaphore(AI_CONCURRENCY)
+
+        async def analyze_one(crawler, article):
+            async with sem:
                 target_url = ensure_http(article.url)
-                print(f"[AI] 分析: {article.title}")
-
-                result = await crawler.arun(url=target_url, cache_mode=CacheMode.BYPASS, magic=True)
-
-                if result.success:
-                    article.content_raw = result.markdown
-                    content_snippet = result.markdown[:6000]
-
-                    prompt = f"""
-                    你是情报分析师。今天是 {current_date}。
-                    【客户画像】{settings.client_profile}
-                    【重点关注竞争对手】{comp_str}
-                    【分类标准】议题: {topics_str}
-                    【新闻内容】{content_snippet}
-                    请返回 JSON：{{
-                        "议题": "...", "类别": "...", "摘要": "...", 
-                        "中文标题": "...", "英文标题": "...",
-                        "评分": <0-10>, "打分理由": "...",
-                        "评分详情": {{ "战略": 0, "行业": 0, "时效": 0, "风险": 0, "落地": 0 }}
-                    }}
-                    """
+                logger.info("AI 分析: %s", article.title)
+
+                # 仅在重试上次失败的分析时复用已抓取的非空正文；其余情况重新抓取，
+                # 以便上次抓到拦截页/空白页或原文更新后，重新分析即可刷新正文
+                content = None
+                if article.ai_status == "error" and article.content_raw:
+                    content = article.content_raw
+                else:
+                    result = await crawler.arun(url=target_url, cache_mode=CacheMode.BYPASS, magic=True)
+                    if result.success:
+                        content = article.content_raw = result.markdown
+
+                if content is not None:
+                    content_snippet = content[:6000]
+
+                    prompt = ANALYZE_PROMPT.format(
+                        current_date=current_date, client_profile=settings.client_profile,
+                        comp_str=comp_str, topics_str=topics_str, content=content_snippet
+                    )
                     try:
-                        response = AI_CLIENT.chat.completions.create(
+                        # 同步 SDK 调用放到线程中执行，避免阻塞事件循环
+                        response = await asyncio.to_thread(
+                            AI_CLIENT.chat.completions.create,
                             model="deepseek-chat",
                             messages=[{"role": "user", "content": prompt}],
                             response_format={"type": "json_object"}
                         )
                         ai_data = json.loads(response.choices[0].message.content)
-                        article.ai_topic = ai_data.get("议题")
-                        article.ai_category = ai_data.get("类别")
-                        article.ai_summary = ai_data.get("摘要")
-                        article.new_title = ai_data.get("中文标题")
-                        article.title_en = ai_data.get("英文标题")
-                        article.ai_score = ai_data.get("评分")
-                        article.ai_reasoning = ai_data.get("打分理由")
+                        # 先校验全部字段再赋值，格式不对的返回整条记为 error，不影响同批其它文章
+                        topic, category, summary, new_title, title_en, reasoning = (
+                            ai_text(ai_data.get(k)) for k in ("议题", "类别", "摘要", "中文标题", "英文标题", "打分理由"))
+                        score = ai_data.get("评分")
+                        score = float(score) if score is not None else None
+                        article.ai_topic = topic
+                        article.ai_category = category
+                        article.ai_summary = summary
+                        article.new_title = new_title
+                        article.title_en = title_en
+                        article.ai_score = score
+                        article.ai_reasoning = reasoning
                         article.ai_score_details = json.dumps(ai_data.get("评分详情", {}), ensure_ascii=False)
                         article.ai_status = "done"
-                    except Exception as e:
-                        print(f"[ERROR] AI: {e}")
+                    except Exception:
+                        logger.exception("AI 分析失败: %s", article.url)
                         article.ai_status = "error"
                 else:
                     article.ai_status = "error"
-                session.add(article)
-                session.commit()
                 results.append(article)
+
+        async with AsyncWebCrawler(config=browser_config) as crawler:
+            # 抓取正文与 AI 调用都是网络 I/O，按 AI_CONCURRENCY 限流并发执行
+            # 单篇任务抛出的异常不应中断整批，否则已完成 (已付费) 的分析结果都不会提交
+            outcomes = await asyncio.gather(*(analyze_one(crawler, a) for a in articles), return_exceptions=True)
+
+        for article, outcome in zip(articles, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("AI 分析任务异常 %s: %s", article.url, outcome, exc_info=outcome)
+                article.ai_status = "error"
+
+        # 整批结束后统一提交一次：逐条 commit 会让其余已加载文章全部过期，下一条访问时又要重新 SELECT
+        session.commit()
     return len(results)
 
 
 # === AI 自动探测 ===
 async def auto_detect_config(url: str):
     target_url = ensure_http(url)
-    print(f"[DETECT] 探测: {target_url}")
+    logger.info("探测: %s", target_url)
     browser_config = BrowserConfig(headless=True)
 
     async with AsyncWebCrawler(config=browser_config) as crawler:
@@ -289,27 +408,23 @@ async def auto_detect_config(url: str):
     for tag in soup(['script', 'style']): tag.decompose()
     clean_html = str(soup.body)[:30000]
 
-    prompt = f"""
-    分析 HTML 找出新闻列表 CSS 选择器。
-    特别任务：观察 HTML 里的日期格式。
-    返回 JSON: list, title, link, date, date_format, next_page.
-    HTML: {clean_html}
-    """
+    prompt = DETECT_PROMPT.format(html=clean_html)
     try:
-        response = AI_CLIENT.chat.completions.create(model="deepseek-chat",
-                                                     messages=[{"role": "user", "content": prompt}],
-                                                     response_format={"type": "json_object"})
+        response = await asyncio.to_thread(AI_CLIENT.chat.completions.create, model="deepseek-chat",
+                                           messages=[{"role": "user", "content": prompt}],
+                                           response_format={"type": "json_object"})
         result_data = json.loads(response.choices[0].message.content)
         # 确保返回的URL包含正确的协议前缀
         result_data["url"] = ensure_http(result_data.get("url", url))
         return result_data
     except Exception as e:
+        logger.exception("AI 探测失败: %s", target_url)
         return {"error": str(e)}
 
 
 async def test_crawler_config(url, selectors):
     target_url = ensure_http(url)
-    print(f"[TEST] 测试: {target_url}")
+    logger.info("测试: %s", target_url)
     browser_config = BrowserConfig(headless=False, verbose=True)
     fields = [{"name": "title", "selector": selectors['title'], "type": "text"},
               {"name": "url", "selector": selectors['link'], "type": "attribute", "attribute": "href"}]
@@ -321,9 +436,10 @@ async def test_crawler_config(url, selectors):
         async with AsyncWebCrawler(config=browser_config) as crawler:
             result = await crawler.arun(url=target_url, config=run_config)
             if not result.success: return {"success": False, "error": result.error_message}
-            items = json.loads(result.extracted_content)
+            items = load_extracted(result.extracted_content)
             return {"success": True, "count": len(items), "data": items[:3]}
     except Exception as e:
+        logger.exception("配置测试失败: %s", target_url)
         return {"success": False, "error": str(e)}
 
 
@@ -332,7 +448,7 @@ async def test_pagination_logic(url: str, selectors: dict):
     尝试抓取前 2 页，验证分页配置是否正确
     """
     base_url = ensure_http(url)
-    print(f"[TEST PAGINATION] 开始测试: {base_url}")
+    logger.info("分页测试: %s", base_url)
 
     # 判断模式
     is_number_pagination = "{n}" in base_url
@@ -377,7 +493,7 @@ async def test_pagination_logic(url: str, selectors: dict):
                 report["pages"].append(f"第 {page_num} 页: 无法获取 URL，停止。")
                 break
 
-            print(f"   Testing Page {page_num}: {target_url}")
+            logger.debug("分页测试第 %d 页: %s", page_num, target_url)
 
             # 2. 抓取
             result = await crawler.arun(url=target_url, config=run_config)
@@ -388,8 +504,8 @@ async def test_pagination_logic(url: str, selectors: dict):
 
             # 3. 分析结果
             try:
-                items = json.loads(result.extracted_content)
-            except:
+                items = load_extracted(result.extracted_content)
+            except (TypeError, ValueError):  # 无抽取结果 (None) 或 JSON 不合法
                 items = []
 
             item_count = len(items)
@@ -416,7 +532,6 @@ async def test_pagination_logic(url: str, selectors: dict):
                     page_info["next_url_raw"] = next_link
                     # 补全 URL
                     if not next_link.startswith('http'):
-                        from urllib.parse import urljoin
                         next_link = urljoin(target_url, next_link)
                     current_url = next_link
                 else:
@@ -39,9 +39,9 @@ class Article(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     site_id: int
     title: str
-    url: str
+    url: str = Field(index=True)  # 爬取去重按 URL 查询
     publish_date: Optional[datetime] = None
-    crawled_at: datetime = Field(default_factory=datetime.now)
+    crawled_at: datetime = Field(default_factory=datetime.now, index=True)  # 看板按采集时间倒序
 
     content_raw: Optional[str] = None
 